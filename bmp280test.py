@@ -7,13 +7,29 @@
 # PREREQUISITE LIBRARIES (Must be in your lib folder):
 # 1. adafruit_bus_device
 # 2. adafruit_bmp280
+#
+# PREREQUISITE FILES (Must be next to code.py or in your lib folder):
+# 1. i2c_discovery.py
+# 2. i2c_bus.py
+# 3. sensor_recovery.py
+# 4. memprof.py
+# 5. telemetry.py
+# 6. live_params.py (settings can be changed over serial; type "list" to see them)
 
 import board
-import time
-import busio
 import displayio
 import digitalio # Needed for backlight control
-import adafruit_bmp280
+import i2c_discovery # Finds the BMP280 address (0x77 or 0x76) and caches it
+import i2c_bus       # Shared I2C bus with a configurable clock and scheduler
+import sensor_recovery # Retries a failed sensor in the background
+import memprof       # Heap/GC stats for the main loop
+import telemetry     # Binary records on the USB data port (if enabled in boot.py)
+import live_params   # Change settings over serial without a reboot
+
+# --- Bus/Sampling Settings ---
+I2C_FREQUENCY = 400000      # Bus clock in Hz: 100000, 400000 or 1000000
+SAMPLE_INTERVAL = 2.0       # Seconds between BMP280 readings (can be changed live over serial)
+COMMAND_LATENCY = 0.05      # Longest sleep, so serial commands are handled promptly
 
 # --- 1. Display Shutdown (Power Saving) ---
 
@@ -48,53 +64,74 @@ print("-" * 30)
 
 # --- 2. Sensor Setup ---
 
-# Initialize the I2C bus using the default board pins (SCL and SDA)
-try:
-    i2c = busio.I2C(board.SCL, board.SDA)
+# Initialize the I2C bus using the default board pins (SCL and SDA).
+# If the bus cannot be created yet, the sensor supervisor keeps resetting it.
+bus = i2c_bus.BusManager(frequency=I2C_FREQUENCY)
+if bus.i2c is not None:
     print("I2C bus initialized successfully.")
-except Exception as e:
-    print(f"Error initializing I2C bus: {e}")
-    # Halt program if I2C fails
-    while True:
-        time.sleep(1)
 
 # Initialize the BMP280 sensor object
-try:
-    # Using the fully qualified, legacy class name to resolve potential ImportErrors
-    # The default I2C address is 0x77. Change to: adafruit_bmp280.Adafruit_BMP280_I2C(i2c, address=0x76) if needed.
-    bmp280 = adafruit_bmp280.Adafruit_BMP280_I2C(i2c)
+# The address (0x77 or 0x76) is detected from the chip-ID register on the
+# first boot and read from NVM afterwards, so no code edit is needed.
+# A failed init does not halt the program: the supervisor keeps retrying
+# (with bus resets and backoff) while the main loop runs.
+bmp280 = sensor_recovery.SensorSupervisor(
+    "BMP280", bus, lambda i2c: i2c_discovery.find_sensor(i2c, "BMP280")
+)
+if bmp280.start():
     print("BMP280 sensor found and initialized.")
-except ValueError:
-    print("BMP280 not found at default I2C address (0x77). Check wiring or address (try 0x76).")
-    while True:
-        time.sleep(5)
-except Exception as e:
-    print(f"An unexpected error occurred during BMP280 initialization: {e}")
-    while True:
-        time.sleep(5)
+else:
+    print("BMP280 not available yet. Check wiring; retrying in the background.")
 
 
 # --- 3. Main Loop: Read and Print Data ---
 
 print("Starting BMP280 data logger...")
 
+def sample_bmp280(sensor):
+    """Reads (temperature, pressure, altitude) from the driver"""
+    return sensor.temperature, sensor.pressure, sensor.altitude
+
+def read_bmp280():
+    """Bus task: returns one reading (None while the sensor is down or recovering)"""
+    return bmp280.read(sample_bmp280)
+
+def print_bmp280(data):
+    """Prints one block of data (kept out of the bus task so it is not timed as bus use)"""
+    temperature_c, pressure, altitude = data
+    temperature_f = (temperature_c * 9 / 5) + 32
+    telemetry.send(telemetry.RECORD_BMP280, temperature_c, pressure, altitude)
+
+    # Print data to the serial console (Python Interpreter)
+    print("-" * 30)
+    print(f"Temperature: {temperature_c:.2f} C / {temperature_f:.2f} F")
+    print(f"Pressure:    {pressure:.2f} hPa")
+    print(f"Altitude:    {altitude:.2f} meters")
+    print("-" * 30)
+
+bus.add_task("BMP280", read_bmp280, SAMPLE_INTERVAL)
+
+profiler = memprof.LoopProfiler()
+
+def set_sample_interval(value):
+    """Applies a new sample interval from the serial console"""
+    bus.set_interval("BMP280", value)
+
+params = live_params.LiveParams()
+params.define("SAMPLE_INTERVAL", SAMPLE_INTERVAL, 0.01, 3600.0, on_change=set_sample_interval)
+
 while True:
-    try:
-        # Read sensor data
-        temperature_c = bmp280.temperature
-        temperature_f = (temperature_c * 9 / 5) + 32
-        pressure = bmp280.pressure
-        altitude = bmp280.altitude
-
-        # Print data to the serial console (Python Interpreter)
-        print("-" * 30)
-        print(f"Temperature: {temperature_c:.2f} C / {temperature_f:.2f} F")
-        print(f"Pressure:    {pressure:.2f} hPa")
-        print(f"Altitude:    {altitude:.2f} meters")
-        print("-" * 30)
-
-    except Exception as e:
-        print(f"Error reading sensor data: {e}")
-
-    # Wait for 2 seconds before the next reading
-    time.sleep(2)
+    with profiler:
+        # Apply any settings typed into the serial console (no reboot, sensor state is kept)
+        params.poll()
+
+        # Recovery attempts never sleep, so they can run on every pass
+        bmp280.poll()
+        bus.run_pending()
+
+        data = bus.take("BMP280")
+        if data is not None:
+            print_bmp280(data)
+
+    # Sleep until the next reading, recovery attempt or command check is due
+    profiler.sleep(min(bus.time_until_next(), bmp280.time_until_retry(), COMMAND_LATENCY))
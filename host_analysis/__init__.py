@@ -0,0 +1,35 @@
+# Host-side analysis of recorded BMP280/QMI8658C data
+#
+# Runs on a PC (not on the board) and needs NumPy. Reads the console text
+# printed by the board scripts or the binary records from telemetry.py,
+# converts them to memory-mapped NumPy arrays, and computes derived
+# quantities in bulk. See `python -m host_analysis --help`.
+
+from .derive import (
+    altitude_m,
+    c_to_f,
+    common_timebase,
+    integrate_gyro,
+    resample,
+    split_at_reboots,
+)
+from .formats import BMP280_DTYPE, DTYPES, MEMORY_DTYPE, QMI8658C_DTYPE
+from .store import convert, detect_format, iter_slices, open_arrays, open_capture
+
+__all__ = [
+    "BMP280_DTYPE",
+    "DTYPES",
+    "MEMORY_DTYPE",
+    "QMI8658C_DTYPE",
+    "altitude_m",
+    "c_to_f",
+    "common_timebase",
+    "convert",
+    "detect_format",
+    "integrate_gyro",
+    "iter_slices",
+    "open_arrays",
+    "open_capture",
+    "resample",
+    "split_at_reboots",
+]
@@ -0,0 +1,117 @@
+# Command line entry point
+#
+#   python -m host_analysis convert capture.log out/      # text or binary
+#   python -m host_analysis summary out/
+
+import argparse
+
+import numpy as np
+
+from .derive import SEA_LEVEL_HPA, altitude_m, c_to_f, integrate_gyro
+from .store import convert, iter_slices, open_arrays
+
+
+class _Range:
+    """Running min/mean/max over chunks"""
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.low = np.inf
+        self.high = -np.inf
+
+    def add(self, values):
+        if len(values):
+            self.count += len(values)
+            self.total += float(np.sum(values, dtype=np.float64))
+            self.low = min(self.low, float(np.min(values)))
+            self.high = max(self.high, float(np.max(values)))
+
+    def __str__(self):
+        if not self.count:
+            return "n/a"
+        mean = self.total / self.count
+        return f"min {self.low:.2f}  mean {mean:.2f}  max {self.high:.2f}"
+
+
+def _summarize_bmp280(records, sea_level_hpa):
+    temperature_c, temperature_f, pressure, altitude = _Range(), _Range(), _Range(), _Range()
+    for part in iter_slices(records):
+        temperature_c.add(part["temperature_c"])
+        temperature_f.add(c_to_f(part["temperature_c"]))
+        pressure.add(part["pressure_hpa"])
+        altitude.add(altitude_m(part["pressure_hpa"], sea_level_hpa))
+    print(f"  Temperature (C):  {temperature_c}")
+    print(f"  Temperature (F):  {temperature_f}")
+    print(f"  Pressure (hPa):   {pressure}")
+    print(f"  Altitude (m):     {altitude}  (sea level {sea_level_hpa} hPa)")
+
+
+def _summarize_qmi8658c(records):
+    magnitude, temperature_c = _Range(), _Range()
+    state = None
+    for part in iter_slices(records):
+        magnitude.add(np.linalg.norm(part["accel"], axis=1))
+        temperature_c.add(part["temperature_c"])
+        _, state = integrate_gyro(part["t"], part["gyro"], state)
+    print(f"  |Acceleration| (m/s^2): {magnitude}")
+    print(f"  Temperature (C):        {temperature_c}")
+    if state is not None:
+        x, y, z = state[2]
+        print(f"  Integrated gyro (deg):  ({x:.1f}, {y:.1f}, {z:.1f})")
+
+
+def _summarize_memory(records):
+    free, frame_gc = _Range(), _Range()
+    for part in iter_slices(records):
+        free.add(part["mem_free"])
+        frame_gc.add(part["frame_collections"])
+    print(f"  Free heap (bytes):        {free}")
+    print(f"  Frames where heap shrank: {frame_gc}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m host_analysis",
+        description="Convert and summarize recorded BMP280/QMI8658C captures.",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    convert_parser = commands.add_parser("convert", help="capture -> memory-mapped arrays")
+    convert_parser.add_argument("capture")
+    convert_parser.add_argument("out_dir")
+    convert_parser.add_argument("--format", choices=("auto", "text", "binary"), default="auto")
+    convert_parser.add_argument("--chunk-mb", type=int, default=64)
+
+    summary_parser = commands.add_parser("summary", help="statistics of converted arrays")
+    summary_parser.add_argument("out_dir")
+    summary_parser.add_argument("--sea-level", type=float, default=SEA_LEVEL_HPA)
+
+    args = parser.parse_args(argv)
+
+    if args.command == "convert":
+        counts = convert(
+            args.capture, args.out_dir, args.format, chunk_bytes=args.chunk_mb * 1024 * 1024
+        )
+        for kind, count in counts.items():
+            print(f"{kind:<10} {count} records")
+        return 0
+
+    arrays = open_arrays(args.out_dir)
+    if not arrays:
+        print(f"No converted data in {args.out_dir}")
+        return 1
+    for kind, records in arrays.items():
+        t = records["t"]
+        print(f"{kind}: {len(records)} records, t = {t[0]:.1f} .. {t[-1]:.1f} s")
+        if kind == "bmp280":
+            _summarize_bmp280(records, args.sea_level)
+        elif kind == "qmi8658c":
+            _summarize_qmi8658c(records)
+        else:
+            _summarize_memory(records)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
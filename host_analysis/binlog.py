@@ -0,0 +1,232 @@
+# Reader for binary telemetry captures (records written by telemetry.py)
+#
+# The capture is memory-mapped and processed in fixed-size windows, so a
+# multi-gigabyte file never has to fit in RAM. Within a window, record
+# boundaries are found with array operations instead of a Python loop over
+# records:
+#
+#   1. every 0xA5 byte whose type and length fields are valid is a candidate
+#   2. each candidate points at the candidate that should follow it
+#   3. one pointer doubling pass (log2(n) array steps) labels every
+#      candidate with the last record of its chain
+#   4. the chain starting at the window's first byte is used; if it breaks
+#      (bytes lost on the serial link), reading resumes at the next valid
+#      candidate after the chain's end and the gap is counted
+#   5. a second doubling pass marks every record reached from those starts
+#
+# Sync bytes that happen to appear inside a payload are never on a chain,
+# so they are ignored. A record cut short by the loss (it overlaps the next
+# valid record) is dropped. The cost per window stays a few array passes no
+# matter how many times reading has to resynchronize.
+
+import mmap
+
+import numpy as np
+
+from .formats import (
+    DTYPES,
+    HEADER_SIZE,
+    MAX_RECORD_SIZE,
+    RECORD_TYPES,
+    SYNC,
+)
+
+DEFAULT_CHUNK_BYTES = 64 * 1024 * 1024
+
+# The 32-bit millisecond stamp wraps every ~49.7 days. A backwards step only
+# counts as a wrap if the records would then be at most this far apart;
+# anything else is a reboot (the counter restarts near 0, so the previous
+# stamp is rarely within this of 2**32). A reboot that lands within this
+# window of a wrap is still read as a wrap.
+MAX_WRAP_GAP_MS = 60 * 60 * 1000
+
+# Expected payload length per type byte (0 = unknown type)
+_EXPECTED_LENGTH = np.zeros(256, dtype=np.int64)
+for _type, (_kind, _payload) in RECORD_TYPES.items():
+    _EXPECTED_LENGTH[_type] = _payload.itemsize
+
+
+def _chain_ends(nxt):
+    """Returns, for every candidate, the index of the last candidate on its chain"""
+    m = len(nxt) - 1
+    index = np.arange(m)
+    end = np.where(nxt[:-1] == m, index, nxt[:-1])
+    while True:
+        after = end[end]
+        if np.array_equal(after, end):
+            return end
+        end = after
+
+
+def _reached(nxt, starts):
+    """Returns a mask of the candidates reached from `starts` by following nxt"""
+    on = np.zeros(len(nxt), dtype=bool)
+    on[starts] = True
+    jump = nxt
+    while True:
+        count = np.count_nonzero(on)
+        on[jump[on]] = True
+        if np.count_nonzero(on) == count:
+            break
+        jump = jump[jump]
+    return on[:-1] # Drop the sentinel
+
+
+def _frame(buf, final):
+    """Finds the record start offsets in one window.
+
+    Returns (offsets, consumed, resyncs, skipped): the record offsets in file
+    order, how many bytes of the window were fully used, and how many times
+    (and over how many bytes) reading had to resynchronize.
+    """
+    n = len(buf)
+    if n < HEADER_SIZE:
+        return np.empty(0, dtype=np.int64), (n if final else 0), 0, 0
+
+    cand = np.flatnonzero(buf[:n - HEADER_SIZE + 1] == SYNC)
+    lengths = buf[cand + 2].astype(np.int64) | (buf[cand + 3].astype(np.int64) << 8)
+    expected = _EXPECTED_LENGTH[buf[cand + 1]]
+    ends = cand + HEADER_SIZE + lengths
+    valid = (expected > 0) & (lengths == expected) & (ends <= n)
+    cand = cand[valid]
+    ends = ends[valid]
+
+    # nxt[i] = index of the candidate starting where record i ends (or sentinel)
+    m = len(cand)
+    j = np.searchsorted(cand, ends)
+    follows = j < m
+    follows[follows] = cand[j[follows]] == ends[follows]
+    nxt = np.append(np.where(follows, j, m), m)
+    chain_end = _chain_ends(nxt) if m else nxt[:0]
+
+    # Records starting past this point might be cut off by the window edge
+    limit = n if final else n - MAX_RECORD_SIZE
+    starts = []
+    dropped = []
+    offset = 0
+    resyncs = 0
+    skipped = 0
+    while offset < limit:
+        k = np.searchsorted(cand, offset)
+        if k == m or cand[k] >= limit:
+            break
+        if cand[k] != offset:
+            resyncs += 1
+            skipped += int(cand[k]) - offset
+        starts.append(k)
+        last = chain_end[k]
+        offset = int(ends[last])
+
+        # A record that runs into the next valid record lost bytes on the
+        # link and swallowed part of its neighbour: drop it, resume there
+        k_next = np.searchsorted(cand, cand[last] + 1)
+        if k_next < m and cand[k_next] < offset:
+            dropped.append(last)
+            resyncs += 1
+            skipped += int(cand[k_next] - cand[last])
+            offset = int(cand[k_next])
+
+    if final:
+        if offset < n:
+            skipped += n - offset
+        offset = n
+    if not starts:
+        return np.empty(0, dtype=np.int64), offset, resyncs, skipped
+    on = _reached(nxt, starts)
+    on[dropped] = False
+    return cand[on], offset, resyncs, skipped
+
+
+def _gather(buf, offsets, start, size):
+    """Copies `size` bytes at offsets + start into a (len, size) uint8 array"""
+    index = offsets[:, None] + (start + np.arange(size))
+    return buf[index]
+
+
+class BinaryLogReader:
+    """Streams a binary telemetry capture as chunks of structured arrays"""
+
+    def __init__(self, path, chunk_bytes=DEFAULT_CHUNK_BYTES):
+        self.path = path
+        self.chunk_bytes = max(chunk_bytes, 4 * MAX_RECORD_SIZE)
+        self.resyncs = 0
+        self.skipped_bytes = 0
+        self._last_ms = None
+        self._wrap_ms = 0
+
+    def _unwrap(self, ms):
+        """Extends the 32-bit millisecond counter across wrap-arounds (~49.7 days).
+
+        The wrap offset starts over at every reboot, so times stay relative
+        to the boot they belong to and go backwards there.
+        """
+        ms = ms.astype(np.int64)
+        if self._last_ms is not None:
+            ms = np.concatenate(([self._last_ms], ms))
+        step = np.diff(ms, prepend=ms[0])
+        wrapped = (step < 0) & (step + (1 << 32) <= MAX_WRAP_GAP_MS)
+        rebooted = (step < 0) & ~wrapped
+
+        # Wraps since the start of the chunk, minus those before the last reboot
+        count = np.cumsum(wrapped)
+        run = np.cumsum(rebooted)
+        base = np.concatenate(([0], count[rebooted]))[run]
+        carried = np.where(run == 0, self._wrap_ms, 0)
+        offset = (count - base) * (1 << 32) + carried
+
+        full = ms + offset
+        if self._last_ms is not None:
+            full = full[1:]
+        self._wrap_ms = int(offset[-1])
+        self._last_ms = int(ms[-1])
+        return full
+
+    def __iter__(self):
+        """Yields {kind: structured array} for each window of the file"""
+        with open(self.path, "rb") as f:
+            try:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                return # Empty file
+            data = buf = None
+            try:
+                data = np.frombuffer(mm, dtype=np.uint8)
+                size = len(data)
+                pos = 0
+                while pos < size:
+                    final = pos + self.chunk_bytes >= size
+                    buf = data[pos:pos + self.chunk_bytes]
+                    offsets, consumed, resyncs, skipped = _frame(buf, final)
+                    self.resyncs += resyncs
+                    self.skipped_bytes += skipped
+                    if len(offsets):
+                        yield self._decode(buf, offsets)
+                    if consumed == 0:
+                        # No complete record fits: skip ahead instead of looping
+                        consumed = len(buf) - MAX_RECORD_SIZE
+                        self.skipped_bytes += consumed
+                    pos += consumed
+            finally:
+                # The map can only be closed once no array views point into it
+                data = buf = None
+                mm.close()
+
+    def _decode(self, buf, offsets):
+        """Splits framed records by type into output arrays"""
+        types = buf[offsets + 1]
+        ms = _gather(buf, offsets, 4, 4).view("<u4").ravel()
+        t = self._unwrap(ms) / 1000.0
+
+        chunk = {}
+        for record_type, (kind, payload_dtype) in RECORD_TYPES.items():
+            mask = types == record_type
+            if not mask.any():
+                continue
+            raw = _gather(buf, offsets[mask], HEADER_SIZE, payload_dtype.itemsize)
+            payload = raw.view(payload_dtype).ravel()
+            out = np.empty(len(payload), dtype=DTYPES[kind])
+            out["t"] = t[mask]
+            for name in payload_dtype.names:
+                out[name] = payload[name]
+            chunk[kind] = out
+        return chunk
@@ -0,0 +1,86 @@
+# Vectorized derived quantities
+#
+# Everything here works on whole arrays (or memory-mapped arrays), and the
+# functions that need history take and return a small state value so they
+# can be applied chunk by chunk to captures larger than RAM.
+
+import numpy as np
+
+SEA_LEVEL_HPA = 1013.25
+
+
+def altitude_m(pressure_hpa, sea_level_hpa=SEA_LEVEL_HPA):
+    """Altitude from pressure, using the same formula as adafruit_bmp280"""
+    ratio = np.asarray(pressure_hpa, dtype=np.float64) / sea_level_hpa
+    return 44330.0 * (1.0 - np.power(ratio, 0.1903))
+
+
+def c_to_f(temperature_c):
+    """Celsius to Fahrenheit"""
+    return np.asarray(temperature_c, dtype=np.float64) * 9.0 / 5.0 + 32.0
+
+
+def integrate_gyro(t, gyro_dps, state=None, max_gap=1.0):
+    """Integrates angular rate (degrees/s) into angles (degrees).
+
+    Uses the trapezoidal rule. Steps longer than `max_gap` seconds, or where
+    time goes backwards (a reboot), add nothing. Pass the returned state into
+    the next call to continue across chunks.
+
+    Returns (angles, state) with one column of angles per gyro axis.
+    """
+    t = np.asarray(t, dtype=np.float64)
+    rates = np.asarray(gyro_dps, dtype=np.float64)
+    if rates.ndim == 1:
+        rates = rates[:, None]
+    if state is not None:
+        t_prev, rate_prev, angle_prev = state
+        t = np.concatenate(([t_prev], t))
+        rates = np.vstack((rate_prev, rates))
+    elif len(t) == 0:
+        return np.empty(rates.shape), None
+    else:
+        angle_prev = np.zeros(rates.shape[1])
+
+    dt = np.diff(t)
+    dt[(dt <= 0) | (dt > max_gap)] = 0.0
+    steps = 0.5 * (rates[1:] + rates[:-1]) * dt[:, None]
+    angles = np.empty_like(rates)
+    angles[0] = angle_prev
+    np.cumsum(steps, axis=0, out=angles[1:])
+    angles[1:] += angle_prev
+
+    if state is not None:
+        angles = angles[1:]
+    new_state = (t[-1], rates[-1].copy(), angles[-1].copy() if len(angles) else angle_prev)
+    return angles, new_state
+
+
+def common_timebase(*times, period):
+    """Evenly spaced times covering the span all the given series share"""
+    start = max(float(np.min(t)) for t in times)
+    stop = min(float(np.max(t)) for t in times)
+    if stop < start:
+        return np.empty(0)
+    return np.arange(start, stop + period / 2, period)
+
+
+def resample(t, values, t_new):
+    """Linearly interpolates values (1-D, or 2-D with one column per axis) onto t_new.
+
+    `t` must be increasing; split captures at reboots first.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    if values.ndim == 1:
+        return np.interp(t_new, t, values)
+    out = np.empty((len(t_new), values.shape[1]))
+    for column in range(values.shape[1]):
+        out[:, column] = np.interp(t_new, t, values[:, column])
+    return out
+
+
+def split_at_reboots(t):
+    """Returns slices of monotonic runs, splitting wherever time goes backwards"""
+    breaks = np.flatnonzero(np.diff(t) < 0) + 1
+    edges = np.concatenate(([0], breaks, [len(t)]))
+    return [slice(int(a), int(b)) for a, b in zip(edges[:-1], edges[1:])]
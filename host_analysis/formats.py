@@ -0,0 +1,73 @@
+# Record layouts shared by the text and binary readers
+#
+# Every reader produces NumPy structured arrays with these dtypes, so the
+# rest of the pipeline does not care where the data came from. Field "t" is
+# seconds since the board booted (or the sample index times the nominal
+# interval when the capture has no timestamps).
+
+import numpy as np
+
+# --- Output Arrays (one per kind of record) ---
+BMP280_DTYPE = np.dtype([
+    ("t", "<f8"),
+    ("temperature_c", "<f4"),
+    ("pressure_hpa", "<f4"),
+    ("altitude_m", "<f4"),
+])
+
+QMI8658C_DTYPE = np.dtype([
+    ("t", "<f8"),
+    ("accel", "<f4", (3,)),     # m/s^2
+    ("gyro", "<f4", (3,)),      # degrees/s
+    ("temperature_c", "<f4"),
+])
+
+MEMORY_DTYPE = np.dtype([
+    ("t", "<f8"),
+    ("mem_free", "<u4"),
+    ("mem_alloc", "<u4"),
+    ("min_free", "<u4"),
+    ("iterations", "<u4"),
+    ("allocating_iterations", "<u4"),
+    ("frame_collections", "<u4"),       # frames where the heap shrank
+    ("idle_collections", "<u4"),
+    ("gc_time_us", "<u4"),              # idle collections only
+])
+
+DTYPES = {
+    "bmp280": BMP280_DTYPE,
+    "qmi8658c": QMI8658C_DTYPE,
+    "memory": MEMORY_DTYPE,
+}
+
+# Sample interval of the board scripts, used when a text log has no timestamps
+NOMINAL_INTERVALS = {
+    "bmp280": 2.0,
+    "qmi8658c": 0.5,
+    "memory": 60.0,
+}
+
+# --- Binary Telemetry (must match telemetry.py on the board) ---
+SYNC = 0xA5
+HEADER_SIZE = 8               # sync u8 | type u8 | length u16 | time ms u32
+
+# record type -> (kind, payload dtype)
+RECORD_TYPES = {
+    1: ("bmp280", np.dtype([
+        ("temperature_c", "<f4"),
+        ("pressure_hpa", "<f4"),
+        ("altitude_m", "<f4"),
+    ])),
+    2: ("qmi8658c", np.dtype([
+        ("accel", "<f4", (3,)),
+        ("gyro", "<f4", (3,)),
+        ("temperature_c", "<f4"),
+    ])),
+    3: ("memory", np.dtype([
+        (name, "<u4") for name in MEMORY_DTYPE.names[1:]
+    ])),
+}
+
+MAX_RECORD_SIZE = HEADER_SIZE + max(
+    payload.itemsize for _, payload in RECORD_TYPES.values()
+)
@@ -0,0 +1,87 @@
+# Opening captures and converting them to memory-mapped arrays
+#
+# convert() streams a capture once and appends each kind of record to a flat
+# binary file (<kind>.bin) in the output directory. It warns about data the
+# reader had to drop and raises ValueError when nothing could be read at
+# all, rather than writing empty output. open_arrays() then maps
+# those files as NumPy structured arrays, so months of data can be sliced
+# and reduced without reading it all into RAM.
+
+import os
+import warnings
+
+import numpy as np
+
+from .binlog import BinaryLogReader
+from .formats import DTYPES
+from .textlog import TextLogReader
+
+
+def detect_format(path):
+    """Returns "binary" or "text" by looking at the start of the file"""
+    with open(path, "rb") as f:
+        head = f.read(4096)
+    # Console text never contains NUL bytes; packed records almost always do
+    return "binary" if b"\x00" in head else "text"
+
+
+def open_capture(path, fmt="auto", chunk_bytes=None):
+    """Returns a reader that yields {kind: structured array} chunks"""
+    if fmt == "auto":
+        fmt = detect_format(path)
+    reader_class = {"binary": BinaryLogReader, "text": TextLogReader}.get(fmt)
+    if reader_class is None:
+        raise ValueError(f"Unknown capture format: {fmt}")
+    if chunk_bytes is None:
+        return reader_class(path)
+    return reader_class(path, chunk_bytes=chunk_bytes)
+
+
+def convert(path, out_dir, fmt="auto", chunk_bytes=None):
+    """Streams a capture into <out_dir>/<kind>.bin files; returns record counts"""
+    os.makedirs(out_dir, exist_ok=True)
+    files = {}
+    counts = {kind: 0 for kind in DTYPES}
+    reader = open_capture(path, fmt, chunk_bytes)
+    try:
+        for chunk in reader:
+            for kind, records in chunk.items():
+                if kind not in files:
+                    files[kind] = open(os.path.join(out_dir, kind + ".bin"), "wb")
+                records.tofile(files[kind])
+                counts[kind] += len(records)
+    finally:
+        for f in files.values():
+            f.close()
+    # Drop stale output from an earlier conversion of a different capture
+    for kind in DTYPES:
+        stale = os.path.join(out_dir, kind + ".bin")
+        if kind not in files and os.path.exists(stale):
+            os.remove(stale)
+
+    if not any(counts.values()) and os.path.getsize(path) > 0:
+        raise ValueError(f"No records recognized in {path}; is it the right format?")
+    if getattr(reader, "unparsed", 0):
+        warnings.warn(f"{path}: {reader.unparsed} record blocks could not be parsed")
+    if getattr(reader, "resyncs", 0):
+        warnings.warn(
+            f"{path}: lost sync {reader.resyncs} times, "
+            f"{reader.skipped_bytes} bytes skipped"
+        )
+    return counts
+
+
+def open_arrays(out_dir):
+    """Maps every converted <kind>.bin in out_dir as a read-only structured array"""
+    arrays = {}
+    for kind, dtype in DTYPES.items():
+        path = os.path.join(out_dir, kind + ".bin")
+        if os.path.exists(path) and os.path.getsize(path) >= dtype.itemsize:
+            arrays[kind] = np.memmap(path, dtype=dtype, mode="r")
+    return arrays
+
+
+def iter_slices(array, size=1 << 20):
+    """Yields consecutive views of at most `size` records for chunked processing"""
+    for start in range(0, len(array), size):
+        yield array[start:start + size]
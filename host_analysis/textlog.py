@@ -0,0 +1,157 @@
+# Reader for the serial console output of the board scripts
+#
+# Understands the blocks printed by bmp280test.py, qmi8658c._sensor_test.py
+# and multisensor.py, plus the "MEM ..." lines from memprof.py. Lines may
+# carry a leading timestamp in seconds, e.g. "[12.345] Pressure: ...", or
+# elapsed time plus delta as written by grabserial -t,
+# e.g. "[12.345000 0.002000] Pressure: ..." (only the first number is used).
+# Without one, sample times are synthesized from the nominal sample intervals.
+#
+# Blocks that start like a record but do not match its pattern are counted
+# in `unparsed`, so a log in an unexpected format does not go unnoticed.
+#
+# The log is memory-mapped and scanned window by window with compiled byte
+# regexes, so the per-line work happens in C and the file is never loaded
+# whole.
+
+import mmap
+import re
+
+import numpy as np
+
+from .formats import DTYPES, NOMINAL_INTERVALS
+
+DEFAULT_CHUNK_BYTES = 64 * 1024 * 1024
+
+# --- Patterns ---
+_NUM = rb"(-?\d+(?:\.\d+)?(?:[eE][-+]?\d+)?)"
+_SECONDS = rb"\d+(?:\.\d+)?"
+_DELTA = rb"(?:[ \t]+" + _SECONDS + rb")?"     # grabserial -t adds a delta
+_STAMP = (                                     # optional, first number captured
+    rb"^[ \t]*(?:\[?[ \t]*(" + _SECONDS + rb")" + _DELTA + rb"[ \t]*\]?[ \t]+)?"
+)
+_SKIP_STAMP = (                                # line break + stamp
+    rb"\r?\n[ \t]*(?:\[?[ \t]*" + _SECONDS + _DELTA + rb"[ \t]*\]?[ \t]+)?"
+)
+
+_PATTERNS = {
+    "bmp280": re.compile(
+        _STAMP + rb"Temperature:[ \t]+" + _NUM + rb" C / " + _NUM + rb" F"
+        + _SKIP_STAMP + rb"Pressure:[ \t]+" + _NUM + rb" hPa"
+        + _SKIP_STAMP + rb"Altitude:[ \t]+" + _NUM + rb" meters",
+        re.MULTILINE,
+    ),
+    "qmi8658c": re.compile(
+        _STAMP + rb"Acceleration: \(" + _NUM + rb", " + _NUM + rb", " + _NUM + rb"\) m/s\^2"
+        + _SKIP_STAMP + rb"Gyroscope:[ \t]+\(" + _NUM + rb", " + _NUM + rb", " + _NUM + rb"\) degrees/s"
+        + _SKIP_STAMP + rb"Temperature:[ \t]+" + _NUM + rb" \S*C",
+        re.MULTILINE,
+    ),
+    "memory": re.compile(
+        _STAMP + rb"MEM free: (\d+) alloc: (\d+) min free: (\d+) \| "
+        rb"iterations: (\d+) allocating: (\d+) \(\d+ bytes\) \| "
+        rb"heap shrank in frame: (\d+) idle GC: (\d+) avg: " + _NUM + rb" ms",
+        re.MULTILINE,
+    ),
+}
+
+# A line every block of that kind contains, used to count blocks that failed
+# to parse
+_MARKERS = {
+    "bmp280": b"Pressure:",
+    "qmi8658c": b"Acceleration:",
+    "memory": b"MEM free:",
+}
+
+# Every block ends with a dashed separator line, so cutting a window right
+# after one never splits a block
+_SEPARATOR = re.compile(rb"-{10,}\r?\n")
+
+
+def _parse_times(stamps, start_index, interval):
+    """Converts captured stamps to seconds, synthesizing any that are missing"""
+    t = np.arange(start_index, start_index + len(stamps), dtype=np.float64) * interval
+    stamps = np.asarray(stamps, dtype=np.bytes_)
+    present = stamps != b""
+    if present.any():
+        t[present] = stamps[present].astype(np.float64)
+    return t
+
+
+def _to_array(kind, rows, start_index):
+    """Turns regex matches into a structured array for one kind of record"""
+    columns = np.array(rows, dtype=np.bytes_)
+    out = np.empty(len(rows), dtype=DTYPES[kind])
+    out["t"] = _parse_times(columns[:, 0], start_index, NOMINAL_INTERVALS[kind])
+    values = columns[:, 1:].astype(np.float64)
+
+    if kind == "bmp280":
+        # Columns: C, F, hPa, m (the F column is derived, so it is dropped)
+        out["temperature_c"] = values[:, 0]
+        out["pressure_hpa"] = values[:, 2]
+        out["altitude_m"] = values[:, 3]
+    elif kind == "qmi8658c":
+        out["accel"] = values[:, 0:3]
+        out["gyro"] = values[:, 3:6]
+        out["temperature_c"] = values[:, 6]
+    else:
+        names = DTYPES[kind].names[1:]
+        # Same field order as the binary record, except the text line prints
+        # the average idle GC time in ms instead of the total in us
+        for i, name in enumerate(names[:-1]):
+            out[name] = values[:, i]
+        out["gc_time_us"] = values[:, -1] * values[:, 6] * 1000.0
+    return out
+
+
+class TextLogReader:
+    """Streams a console log as chunks of structured arrays"""
+
+    def __init__(self, path, chunk_bytes=DEFAULT_CHUNK_BYTES):
+        self.path = path
+        self.chunk_bytes = max(chunk_bytes, 4096)
+        self._counts = {kind: 0 for kind in _PATTERNS}
+        self.unparsed = 0
+
+    def _cut(self, window, final):
+        """Returns where to end this window without splitting a block"""
+        if final:
+            return len(window)
+        last = None
+        # Only the tail needs searching; blocks are a few hundred bytes long
+        tail_start = max(0, len(window) - 4096)
+        for last in _SEPARATOR.finditer(window, tail_start):
+            pass
+        if last is not None:
+            return last.end()
+        newline = window.rfind(b"\n")
+        return newline + 1 if newline >= 0 else len(window)
+
+    def __iter__(self):
+        """Yields {kind: structured array} for each window of the file"""
+        with open(self.path, "rb") as f:
+            try:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                return # Empty file
+            try:
+                size = len(mm)
+                pos = 0
+                while pos < size:
+                    final = pos + self.chunk_bytes >= size
+                    window = mm[pos:pos + self.chunk_bytes]
+                    end = self._cut(window, final)
+                    window = window[:end]
+
+                    chunk = {}
+                    for kind, pattern in _PATTERNS.items():
+                        rows = pattern.findall(window)
+                        self.unparsed += max(0, window.count(_MARKERS[kind]) - len(rows))
+                        if rows:
+                            chunk[kind] = _to_array(kind, rows, self._counts[kind])
+                            self._counts[kind] += len(rows)
+                    if chunk:
+                        yield chunk
+                    pos += end
+            finally:
+                mm.close()
@@ -0,0 +1,229 @@
+# CircuitPython Shared I2C Bus Manager
+#
+# Copy this file next to code.py (or into /lib). It owns the one I2C bus
+# instance used by every sensor driver, sets its clock speed, and decides
+# which driver gets the bus next.
+#
+# Each driver registers a task (a function that performs its reads) with an
+# interval and a priority. run_pending() runs the tasks that are due, highest
+# priority first and earliest deadline first within a priority, so fast IMU
+# reads are never queued behind slower BMP280 reads. Time spent in each task
+# is recorded so the bus utilization of every device can be printed.
+#
+# All deadlines are kept in integer nanoseconds (time.monotonic_ns()). The
+# float time.monotonic() loses precision as uptime grows (after ~24 days a
+# 0.5 s step rounds away), which would leave a task due on every pass.
+#
+# Tasks should only talk to the bus and return their reading; take() hands it
+# to the main loop, which does the printing. That keeps slow console output
+# out of the utilization numbers.
+#
+# If a device is left holding SDA low (e.g. after a reset mid-transfer),
+# reset() clocks SCL until it lets go, sends a STOP, and recreates the bus.
+# Drivers ask for this through request_reset(); the bus decides whether to
+# do it, and spaces repeated resets out (100 ms, 200 ms, ... up to 30 s)
+# until a driver reports a good transfer again with healthy().
+#
+# NOTE: board.I2C() always runs at the default 100 kHz. To pick another
+# clock speed, create the BusManager instead of calling board.I2C(), and pass
+# bus.i2c to the drivers.
+
+import board
+import busio
+import digitalio
+import time
+
+# Supported bus clock speeds (Hz). 1 MHz (Fast-mode Plus) only works if every
+# device on the bus supports it; the BMP280 and QMI8658C are both fine at 400 kHz.
+FREQUENCIES = (100000, 400000, 1000000)
+
+# --- Reset Rate Limit ---
+RESET_HOLDOFF = 0.1          # Minimum seconds between resets after the first
+MAX_RESET_HOLDOFF = 30.0     # Upper limit while resets keep not helping
+
+
+def clear_bus(scl, sda):
+    """Clocks SCL until a stuck SDA is released, then sends a STOP.
+
+    The pins must not be in use by a busio.I2C. Returns True if SDA is high
+    (bus idle) afterwards.
+    """
+    scl_pin = digitalio.DigitalInOut(scl)
+    sda_pin = digitalio.DigitalInOut(sda)
+    try:
+        sda_pin.switch_to_input(pull=digitalio.Pull.UP)
+        scl_pin.switch_to_output(value=True, drive_mode=digitalio.DriveMode.OPEN_DRAIN)
+
+        # Up to 9 clocks lets a slave finish the byte it thinks it is sending
+        for _ in range(9):
+            if sda_pin.value:
+                break
+            scl_pin.value = False
+            scl_pin.value = True
+
+        # STOP condition: SDA goes low -> high while SCL is high
+        scl_pin.value = False
+        sda_pin.switch_to_output(value=False, drive_mode=digitalio.DriveMode.OPEN_DRAIN)
+        scl_pin.value = True
+        sda_pin.value = True
+        sda_pin.switch_to_input(pull=digitalio.Pull.UP)
+        return sda_pin.value
+    finally:
+        scl_pin.deinit()
+        sda_pin.deinit()
+
+
+class _Task:
+    """Bookkeeping for one scheduled bus client"""
+
+    def __init__(self, name, callback, interval, priority):
+        self.name = name
+        self.callback = callback
+        self.interval_ns = int(interval * 1e9)
+        self.priority = priority
+        self.deadline_ns = time.monotonic_ns()
+        self.runs = 0
+        self.errors = 0
+        self.busy_ns = 0
+        self.result = None
+
+
+class BusManager:
+    """Owns a single I2C bus and schedules the drivers that share it"""
+
+    def __init__(self, scl=None, sda=None, frequency=400000):
+        if frequency not in FREQUENCIES:
+            raise ValueError(f"Unsupported I2C frequency: {frequency}")
+        self.scl = scl if scl is not None else board.SCL
+        self.sda = sda if sda is not None else board.SDA
+        self.frequency = frequency
+        # Bumped on every reset(); drivers created before a reset hold the old bus
+        self.generation = 0
+        self.resets = 0
+        self._reset_holdoff = RESET_HOLDOFF
+        self._next_reset_ns = 0
+        # If the bus cannot be created (e.g. "no pull up found" because a device
+        # holds SDA low), i2c stays None and the next reset() tries again
+        self.i2c = None
+        try:
+            self.i2c = busio.I2C(self.scl, self.sda, frequency=frequency)
+        except RuntimeError:
+            try:
+                self.reset()
+            except RuntimeError as e:
+                print(f"I2C bus not available yet: {e}")
+        self._tasks = []
+        self.reset_stats()
+
+    def reset(self):
+        """Releases a stuck bus and recreates the I2C instance.
+
+        Every driver built on the old instance must be recreated afterwards;
+        compare against `generation` to find out.
+        """
+        if self.i2c is not None:
+            try:
+                self.i2c.deinit()
+            except Exception:
+                pass # Already released
+            self.i2c = None
+        self.generation += 1
+        self.resets += 1
+        clear_bus(self.scl, self.sda)
+        self.i2c = busio.I2C(self.scl, self.sda, frequency=self.frequency)
+
+    def request_reset(self):
+        """Resets the bus unless one was done too recently; returns True if it did.
+
+        Each reset that is not followed by healthy() doubles the wait before
+        the next one, so a bus that cannot be fixed is not reset over and over.
+        """
+        now = time.monotonic_ns()
+        if now < self._next_reset_ns:
+            return False
+        self._next_reset_ns = now + int(self._reset_holdoff * 1e9)
+        self._reset_holdoff = min(self._reset_holdoff * 2, MAX_RESET_HOLDOFF)
+        self.reset()
+        return True
+
+    def healthy(self):
+        """Called after a successful transfer; re-arms fast resets"""
+        self._reset_holdoff = RESET_HOLDOFF
+
+    def add_task(self, name, callback, interval, priority=0):
+        """Registers callback() to run every `interval` seconds; higher priority runs first"""
+        self._tasks.append(_Task(name, callback, interval, priority))
+
+    def set_interval(self, name, interval):
+        """Changes the interval of a registered task"""
+        for task in self._tasks:
+            if task.name == name:
+                task.interval_ns = int(interval * 1e9)
+                task.deadline_ns = min(task.deadline_ns, time.monotonic_ns() + task.interval_ns)
+                return
+        raise KeyError(name)
+
+    def run_pending(self):
+        """Runs due tasks in priority/deadline order"""
+        now = time.monotonic_ns()
+        due = [task for task in self._tasks if task.deadline_ns <= now]
+        due.sort(key=lambda task: (-task.priority, task.deadline_ns))
+
+        for task in due:
+            t0 = time.monotonic_ns()
+            try:
+                task.result = task.callback()
+            except Exception as e:
+                task.errors += 1
+                print(f"Error in I2C task '{task.name}': {e}")
+            task.busy_ns += time.monotonic_ns() - t0
+            task.runs += 1
+
+            # Schedule from the previous deadline to keep a steady rate, but
+            # never try to catch up on missed runs in a burst
+            task.deadline_ns += task.interval_ns
+            now = time.monotonic_ns()
+            if task.deadline_ns <= now:
+                task.deadline_ns = now + task.interval_ns
+
+    def take(self, name):
+        """Returns the latest value returned by a task (None if there is none) and clears it"""
+        for task in self._tasks:
+            if task.name == name:
+                result = task.result
+                task.result = None
+                return result
+        raise KeyError(name)
+
+    def time_until_next(self):
+        """Seconds until the next task is due (0 if one is already due)"""
+        if not self._tasks:
+            return 0
+        wait_ns = min(task.deadline_ns for task in self._tasks) - time.monotonic_ns()
+        return wait_ns / 1e9 if wait_ns > 0 else 0
+
+    def reset_stats(self):
+        """Clears the per-device run, error and busy-time counters"""
+        self._stats_start_ns = time.monotonic_ns()
+        for task in self._tasks:
+            task.runs = 0
+            task.errors = 0
+            task.busy_ns = 0
+
+    def utilization(self):
+        """Returns {name: fraction of wall time spent in that device's task}"""
+        elapsed = time.monotonic_ns() - self._stats_start_ns
+        if elapsed <= 0:
+            return {task.name: 0.0 for task in self._tasks}
+        return {task.name: task.busy_ns / elapsed for task in self._tasks}
+
+    def report(self):
+        """Prints the per-device bus counters to the serial console"""
+        usage = self.utilization()
+        print(f"I2C bus @ {self.frequency // 1000} kHz")
+        for task in self._tasks:
+            avg_ms = task.busy_ns / task.runs / 1e6 if task.runs else 0.0
+            print(
+                f"  {task.name:<10} runs: {task.runs:<6} errors: {task.errors:<4} "
+                f"avg: {avg_ms:.2f} ms  busy: {usage[task.name] * 100:.2f} %"
+            )
@@ -0,0 +1,151 @@
+# CircuitPython I2C Device Discovery and Driver Binding
+#
+# Copy this file next to code.py (or into /lib). It scans the I2C bus once,
+# identifies the onboard sensors by reading their chip-ID registers, and
+# creates the matching driver at the address the chip actually answers on.
+#
+# The result is cached in microcontroller.nvm, so later boots (including
+# soft reboots after saving code.py) go straight to the cached address and
+# skip the scan entirely. If a cached address stops working, the cache is
+# refreshed with a single rescan.
+#
+# PREREQUISITE LIBRARIES (Must be in your lib folder, only for the sensors used):
+# 1. adafruit_bus_device
+# 2. adafruit_bmp280
+# 3. qmi8658c (User's specific library name/structure)
+
+import microcontroller
+
+# --- Known Devices ---
+# (name, candidate addresses, chip-ID register, expected chip-ID)
+# The first address listed is the one the driver uses by default.
+KNOWN_DEVICES = (
+    ("BMP280", (0x77, 0x76), 0xD0, 0x58),
+    ("QMI8658C", (0x6B, 0x6A), 0x00, 0x05),  # WHO_AM_I register
+)
+
+# --- NVM Cache Layout ---
+# Byte 0 holds a marker so an erased or foreign NVM is never trusted,
+# followed by one address byte per entry in KNOWN_DEVICES (0 = not cached).
+NVM_OFFSET = 0
+NVM_MARKER = 0xC2
+
+
+def _nvm():
+    """Returns the NVM bytearray, or None if this board has none"""
+    nvm = getattr(microcontroller, "nvm", None)
+    if nvm is None or len(nvm) < NVM_OFFSET + 1 + len(KNOWN_DEVICES):
+        return None
+    return nvm
+
+
+def load_cache():
+    """Reads the cached {name: address} map from NVM (empty if not valid)"""
+    nvm = _nvm()
+    if nvm is None or nvm[NVM_OFFSET] != NVM_MARKER:
+        return {}
+    cache = {}
+    for index, device in enumerate(KNOWN_DEVICES):
+        address = nvm[NVM_OFFSET + 1 + index]
+        if address in device[1]:
+            cache[device[0]] = address
+    return cache
+
+
+def save_cache(devices):
+    """Writes the {name: address} map to NVM, only touching flash when it changed"""
+    nvm = _nvm()
+    if nvm is None:
+        return
+    record = bytearray(1 + len(KNOWN_DEVICES))
+    record[0] = NVM_MARKER
+    for index, device in enumerate(KNOWN_DEVICES):
+        record[1 + index] = devices.get(device[0], 0)
+    start = NVM_OFFSET
+    if nvm[start:start + len(record)] != record:
+        nvm[start:start + len(record)] = record
+
+
+def _read_chip_id(i2c, address, register):
+    """Reads one chip-ID byte; the bus must already be locked"""
+    buf = bytearray(1)
+    i2c.writeto_then_readfrom(address, bytes([register]), buf)
+    return buf[0]
+
+
+def scan(i2c):
+    """Scans the bus and returns {name: address} for every known chip found"""
+    while not i2c.try_lock():
+        pass
+    found = {}
+    try:
+        present = i2c.scan()
+        for name, addresses, register, chip_id in KNOWN_DEVICES:
+            for address in addresses:
+                if address not in present:
+                    continue
+                try:
+                    if _read_chip_id(i2c, address, register) == chip_id:
+                        found[name] = address
+                        break
+                except OSError:
+                    pass # Something else answers here; keep looking
+    finally:
+        i2c.unlock()
+    return found
+
+
+def _create_driver(i2c, name, address):
+    """Imports and constructs the driver for one known device"""
+    if name == "BMP280":
+        import adafruit_bmp280
+        return adafruit_bmp280.Adafruit_BMP280_I2C(i2c, address=address)
+    if name == "QMI8658C":
+        import qmi8658c
+        try:
+            return qmi8658c.QMI8658C(i2c, address=address)
+        except TypeError:
+            # Library without an address argument only talks to its default
+            if address != KNOWN_DEVICES[1][1][0]:
+                raise ValueError(
+                    f"qmi8658c library has no address argument; cannot use 0x{address:02X}"
+                )
+            return qmi8658c.QMI8658C(i2c)
+    raise ValueError(f"Unknown I2C device: {name}")
+
+
+def find_sensor(i2c, name):
+    """Returns an initialized driver for the named sensor.
+
+    Uses the cached address when there is one. If the sensor is missing from
+    the cache or the cached address fails, the bus is rescanned once and the
+    cache is updated with any chip found at a new address. Raises ValueError
+    if the sensor cannot be found, or the OSError from the cached address if
+    the rescan does not find it either.
+    """
+    address = load_cache().get(name)
+    bind_error = None
+    if address is not None:
+        try:
+            return _create_driver(i2c, name, address)
+        except OSError as e:
+            bind_error = e # Stale cache entry, or a stuck bus
+        except (ValueError, RuntimeError):
+            pass # Stale cache entry; fall through to a fresh scan
+
+    devices = scan(i2c)
+    # Only chips found at a new address change the cache; entries for chips
+    # that are simply not answering right now (a bus glitch) are kept
+    merged = load_cache()
+    merged.update(devices)
+    save_cache(merged)
+
+    address = devices.get(name)
+    if address is None:
+        if bind_error is not None:
+            # The chip was known to be here: report the I/O error so the
+            # caller can treat the bus as stuck rather than the chip as absent
+            raise bind_error
+        raise ValueError(f"{name} not found on the I2C bus")
+    print(f"  -> {name} found at address 0x{address:02X}")
+    return _create_driver(i2c, name, address)
@@ -0,0 +1,129 @@
+# CircuitPython Live Parameter Updates over Serial
+#
+# Copy this file next to code.py (or into /lib). It lets you change the
+# tuning constants of a running script from the serial console, without
+# editing code.py (which would soft-reboot the board, re-run display
+# shutdown and sensor setup, and throw away in-memory state).
+#
+# Type one command per line in the serial terminal:
+#
+#     set FADE_RATE 0.05      (or: FADE_RATE=0.05)
+#     get FADE_RATE
+#     list
+#
+# The script calls poll() once per frame. It only reads the characters that
+# are already waiting, so it never blocks, and new values take effect on the
+# next frame. Values keep the type of their default (bool, int, float, or a
+# tuple such as a color: set PULSE_COLOR 255,0,64). Changes are lost on
+# reset; copy the final values into code.py once you are happy with them.
+
+import math
+import sys
+import supervisor
+
+MAX_LINE = 80 # Longer input lines are discarded
+
+
+class LiveParams:
+    """Named tunable values that can be changed over the serial console"""
+
+    def __init__(self):
+        self._values = {}
+        self._limits = {}
+        self._callbacks = {}
+        self._buffer = ""
+
+    def define(self, name, value, low=None, high=None, on_change=None):
+        """Registers a parameter with its default, optional range and change callback"""
+        self._values[name] = value
+        self._limits[name] = (low, high)
+        if on_change is not None:
+            self._callbacks[name] = on_change
+
+    def __getitem__(self, name):
+        return self._values[name]
+
+    def set(self, name, value):
+        """Converts `value` (a string or a value) to the parameter's type and applies it"""
+        if name not in self._values:
+            raise KeyError(name)
+        value = self._convert(self._values[name], value)
+        low, high = self._limits[name]
+        # For tuples (colors) the range applies to every element
+        for item in (value if isinstance(value, tuple) else (value,)):
+            # NaN compares False against any limit, so it has to be caught first
+            if isinstance(item, float) and (math.isnan(item) or math.isinf(item)):
+                raise ValueError(f"{name} must be a finite number")
+            if (low is not None and item < low) or (high is not None and item > high):
+                raise ValueError(f"{name} must be between {low} and {high}")
+        self._values[name] = value
+        if name in self._callbacks:
+            self._callbacks[name](value)
+        return value
+
+    @staticmethod
+    def _convert(current, value):
+        """Returns `value` converted to the type of `current`"""
+        if not isinstance(value, str):
+            return value
+        if isinstance(current, bool):
+            if value.lower() in ("1", "true", "on", "yes"):
+                return True
+            if value.lower() in ("0", "false", "off", "no"):
+                return False
+            raise ValueError(f"not a bool: {value}")
+        if isinstance(current, int):
+            return int(value)
+        if isinstance(current, float):
+            return float(value)
+        if isinstance(current, tuple):
+            parts = value.replace("(", "").replace(")", "").split(",")
+            if len(parts) != len(current):
+                raise ValueError(f"expected {len(current)} comma-separated values")
+            return tuple(LiveParams._convert(old, part.strip()) for old, part in zip(current, parts))
+        return value
+
+    def poll(self):
+        """Handles any complete command lines waiting on the serial console"""
+        available = supervisor.runtime.serial_bytes_available
+        if not available:
+            return
+        self._buffer += sys.stdin.read(available)
+        while True:
+            end = self._buffer.find("\n")
+            if end < 0:
+                end = self._buffer.find("\r")
+            if end < 0:
+                break
+            line = self._buffer[:end].strip()
+            self._buffer = self._buffer[end + 1:]
+            if line:
+                self._handle(line)
+        if len(self._buffer) > MAX_LINE:
+            self._buffer = ""
+
+    def _handle(self, line):
+        """Runs one set/get/list command and prints the reply"""
+        parts = line.split(None, 2)
+        command = parts[0].lower()
+        if "=" in line and command not in ("set", "get"):
+            # Shorthand: NAME=VALUE
+            name, value = line.split("=", 1)
+            parts = ["set", name.strip(), value]
+            command = "set"
+        try:
+            if command == "list":
+                for name in sorted(self._values):
+                    print(f"OK {name}={self._values[name]}")
+            elif command == "get" and len(parts) == 2:
+                name = parts[1].upper()
+                print(f"OK {name}={self._values[name]}")
+            elif command == "set" and len(parts) == 3:
+                name = parts[1].upper()
+                print(f"OK {name}={self.set(name, parts[2].strip())}")
+            else:
+                print("ERR usage: set NAME VALUE | get NAME | list")
+        except KeyError as e:
+            print(f"ERR unknown parameter: {e}")
+        except ValueError as e:
+            print(f"ERR {e}")
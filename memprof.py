@@ -0,0 +1,137 @@
+# CircuitPython Main-Loop Memory and GC Profiler
+#
+# Copy this file next to code.py (or into /lib). Wrap the work done in each
+# pass of a main loop and replace the loop's time.sleep() with the
+# profiler's sleep():
+#
+#     profiler = memprof.LoopProfiler()
+#     while True:
+#         with profiler:
+#             ...           # one frame / one round of sensor reads
+#         profiler.sleep(0.01)
+#
+# Every pass samples gc.mem_free()/gc.mem_alloc() and counts passes that
+# allocate and passes during which the heap shrank. CircuitPython has no hook
+# for the automatic GC, so a shrinking frame is the only sign that it ran:
+# a collection followed by enough allocation in the same frame shows up as an
+# allocating frame instead, and collections between frames are not seen.
+# When enough garbage has built up, sleep() runs gc.collect() in the idle
+# time before the next frame (only if the slack is longer than a collection
+# usually takes), so collections happen between frames instead of in the
+# middle of one. Only these idle collections are timed.
+#
+# Stats are printed to the serial console every `report_interval` seconds and
+# sent as a RECORD_MEMORY record if telemetry.py is present.
+
+import gc
+import time
+
+try:
+    import telemetry
+except ImportError:
+    telemetry = None # Binary telemetry is optional
+
+
+class LoopProfiler:
+    """Per-iteration heap sampling with GC scheduled into idle time"""
+
+    def __init__(self, report_interval=60.0, collect_after=16384, min_slack=0.005):
+        # collect_after: bytes allocated since the last collection that make
+        # an idle-time gc.collect() worthwhile (None disables it)
+        self.report_interval = report_interval
+        self.collect_after = collect_after
+        self.min_slack = min_slack
+        self._start_alloc = 0
+        self._collected_alloc = gc.mem_alloc()
+        self._last_report_ns = time.monotonic_ns()
+        self.reset()
+
+    def reset(self):
+        """Clears all counters"""
+        self.iterations = 0
+        self.allocating_iterations = 0
+        self.allocated_bytes = 0
+        self.frame_collections = 0   # Frames where the heap shrank
+        self.idle_collections = 0    # gc.collect() run by sleep()
+        self.gc_time_ns = 0          # Time spent in idle collections only
+        self.min_free = gc.mem_free()
+
+    def __enter__(self):
+        self._start_alloc = gc.mem_alloc()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        alloc = gc.mem_alloc()
+        self.iterations += 1
+        if alloc < self._start_alloc:
+            # The heap shrank during the frame, so the automatic GC ran in it
+            # (a collection the frame then out-allocated is not detected)
+            self.frame_collections += 1
+            self._collected_alloc = alloc
+        elif alloc > self._start_alloc:
+            self.allocating_iterations += 1
+            self.allocated_bytes += alloc - self._start_alloc
+        free = gc.mem_free()
+        if free < self.min_free:
+            self.min_free = free
+        return False
+
+    def _gc_estimate(self):
+        """Seconds an idle collection is expected to take"""
+        if not self.idle_collections:
+            return self.min_slack
+        return self.gc_time_ns / self.idle_collections / 1e9
+
+    def collect(self):
+        """Runs gc.collect() now and records how long it took"""
+        t0 = time.monotonic_ns()
+        gc.collect()
+        self.gc_time_ns += time.monotonic_ns() - t0
+        self.idle_collections += 1
+        self._collected_alloc = gc.mem_alloc()
+
+    def sleep(self, seconds):
+        """Sleeps like time.sleep(), using the slack for GC and reports"""
+        # Integer ns: the float time.monotonic() gets too coarse for short
+        # sleeps after a few days of uptime
+        deadline_ns = time.monotonic_ns() + int(seconds * 1e9)
+        if (
+            self.collect_after is not None
+            and gc.mem_alloc() - self._collected_alloc >= self.collect_after
+            and seconds >= max(self.min_slack, 1.5 * self._gc_estimate())
+        ):
+            self.collect()
+        if (
+            self.report_interval is not None
+            and time.monotonic_ns() - self._last_report_ns >= self.report_interval * 1e9
+        ):
+            self.report()
+            self._last_report_ns = time.monotonic_ns()
+        remaining_ns = deadline_ns - time.monotonic_ns()
+        if remaining_ns > 0:
+            time.sleep(remaining_ns / 1e9)
+
+    def values(self):
+        """Returns the counters in RECORD_MEMORY order"""
+        return (
+            gc.mem_free(),
+            gc.mem_alloc(),
+            self.min_free,
+            self.iterations,
+            self.allocating_iterations,
+            self.frame_collections,
+            self.idle_collections,
+            self.gc_time_ns // 1000,
+        )
+
+    def report(self):
+        """Prints the stats to the serial console and sends them as telemetry"""
+        values = self.values()
+        avg_gc_ms = self._gc_estimate() * 1000 if self.idle_collections else 0.0
+        print(
+            f"MEM free: {values[0]} alloc: {values[1]} min free: {values[2]} | "
+            f"iterations: {values[3]} allocating: {values[4]} ({self.allocated_bytes} bytes) | "
+            f"heap shrank in frame: {values[5]} idle GC: {values[6]} avg: {avg_gc_ms:.2f} ms"
+        )
+        if telemetry is not None:
+            telemetry.send(telemetry.RECORD_MEMORY, *values)
@@ -0,0 +1,202 @@
+# CircuitPython Main Program (code.py)
+#
+# This script first ensures the TFT display is fully shut down
+# to conserve power, then reads the BMP280 (temperature/pressure)
+# and the QMI8658C IMU (Accelerometer, Gyro, and Temp) together
+# on one shared I2C bus.
+#
+# The bus manager runs both sensors from a single I2C instance: the IMU is
+# read at a high rate with the higher priority, the BMP280 at a slow rate,
+# and the bus utilization of each device is printed periodically.
+#
+# PREREQUISITE LIBRARIES (Must be in your lib folder):
+# 1. adafruit_bus_device
+# 2. adafruit_bmp280
+# 3. qmi8658c (User's specific library name/structure)
+#
+# PREREQUISITE FILES (Must be next to code.py or in your lib folder):
+# 1. i2c_discovery.py
+# 2. i2c_bus.py
+# 3. sensor_recovery.py
+# 4. memprof.py
+# 5. telemetry.py
+# 6. live_params.py (settings can be changed over serial; type "list" to see them)
+
+import board
+import time
+import displayio
+import digitalio     # Needed for backlight control
+import i2c_discovery # Finds both sensor addresses and caches them
+import i2c_bus       # Shared I2C bus with a configurable clock and scheduler
+import sensor_recovery # Retries a failed sensor in the background
+import memprof       # Heap/GC stats for the main loop
+import telemetry     # Binary records on the USB data port (if enabled in boot.py)
+import live_params   # Change settings over serial without a reboot
+
+# --- Bus/Sampling Settings ---
+I2C_FREQUENCY = 400000      # Bus clock in Hz: 100000, 400000 or 1000000
+IMU_INTERVAL = 0.5          # Seconds between IMU readings
+BMP280_INTERVAL = 2.0       # Seconds between BMP280 readings
+REPORT_INTERVAL = 60.0      # Seconds between bus/fault/memory reports
+# The three intervals above can be changed live over serial, e.g. "set IMU_INTERVAL 0.1"
+COMMAND_LATENCY = 0.05      # Longest sleep, so serial commands are handled promptly
+
+
+# --- 1. Display Shutdown (Power Saving) ---
+
+print("Starting power-saving routine: Disabling TFT Display.")
+
+# A. Release Software Resources
+try:
+    displayio.release_displays()
+    print("  -> Display software resources released.")
+except Exception:
+    pass # Ignore errors if displayio is not fully initialized
+
+# B. Control Backlight Pin for Physical Power Off
+try:
+    # Attempt to use the standard backlight pin name for the Feather S3 TFT
+    if hasattr(board, 'TFT_BACKLIGHT'):
+        backlight = digitalio.DigitalInOut(board.TFT_BACKLIGHT)
+        backlight.direction = digitalio.Direction.OUTPUT
+
+        # Setting the pin low turns off the backlight (often wired to be active high)
+        backlight.value = False
+        print("  -> Backlight pin set LOW. Display should be off.")
+    else:
+        print("  -> WARNING: Backlight pin 'TFT_BACKLIGHT' not found.")
+
+except Exception as e:
+    print(f"FATAL ERROR during backlight control: {e}")
+
+print("TFT Display shutdown sequence complete.")
+print("-" * 40)
+
+
+# --- 2. Sensor Setup ---
+
+# Initialize the shared I2C bus on the board's default pins (board.SCL/board.SDA).
+# If the bus cannot be created yet, the sensor supervisors keep resetting it.
+bus = i2c_bus.BusManager(frequency=I2C_FREQUENCY)
+if bus.i2c is not None:
+    print(f"I2C bus initialized successfully at {I2C_FREQUENCY // 1000} kHz.")
+
+# Initialize both sensors; addresses come from the NVM cache after the first boot.
+# A sensor that fails is retried in the background while the other keeps running.
+bmp280 = sensor_recovery.SensorSupervisor(
+    "BMP280", bus, lambda i2c: i2c_discovery.find_sensor(i2c, "BMP280")
+)
+imu = sensor_recovery.SensorSupervisor(
+    "QMI8658C", bus, lambda i2c: i2c_discovery.find_sensor(i2c, "QMI8658C")
+)
+sensors = (imu, bmp280)
+
+for supervisor in sensors:
+    if supervisor.start():
+        print(f"{supervisor.name} sensor found and initialized.")
+    else:
+        print(f"{supervisor.name} not available yet; retrying in the background.")
+
+
+# --- 3. Main Loop: Scheduled Reads ---
+
+def sample_imu(driver):
+    """Reads (acceleration, gyro, temperature) from the QMI8658C driver"""
+    return driver.acceleration, driver.gyro, driver.temperature
+
+def sample_bmp280(driver):
+    """Reads (temperature, pressure, altitude) from the BMP280 driver"""
+    return driver.temperature, driver.pressure, driver.altitude
+
+def read_imu():
+    """Bus task: returns one QMI8658C reading (None while it is down)"""
+    return imu.read(sample_imu)
+
+def read_bmp280():
+    """Bus task: returns one BMP280 reading (None while it is down)"""
+    return bmp280.read(sample_bmp280)
+
+# Printing happens in the main loop, outside the bus tasks, so the
+# utilization report only counts time spent talking to each device
+
+def print_imu(data):
+    """Prints one block of QMI8658C data"""
+    (acc_x, acc_y, acc_z), (gyro_x, gyro_y, gyro_z), temperature = data
+    telemetry.send(
+        telemetry.RECORD_QMI8658C,
+        acc_x, acc_y, acc_z, gyro_x, gyro_y, gyro_z, temperature,
+    )
+
+    print("-" * 40)
+    print("Acceleration: (%.2f, %.2f, %.2f) m/s^2" % (acc_x, acc_y, acc_z))
+    print("Gyroscope:    (%.2f, %.2f, %.2f) degrees/s" % (gyro_x, gyro_y, gyro_z))
+    print("Temperature:  %.2f °C" % temperature)
+    print("-" * 40)
+
+def print_bmp280(data):
+    """Prints one block of BMP280 data"""
+    temperature_c, pressure, altitude = data
+    temperature_f = (temperature_c * 9 / 5) + 32
+    telemetry.send(telemetry.RECORD_BMP280, temperature_c, pressure, altitude)
+
+    print("-" * 30)
+    print(f"Temperature: {temperature_c:.2f} C / {temperature_f:.2f} F")
+    print(f"Pressure:    {pressure:.2f} hPa")
+    print(f"Altitude:    {altitude:.2f} meters")
+    print("-" * 30)
+
+# The IMU gets the higher priority so it always goes first when both are due
+bus.add_task("QMI8658C", read_imu, IMU_INTERVAL, priority=1)
+bus.add_task("BMP280", read_bmp280, BMP280_INTERVAL, priority=0)
+
+print("Starting combined BMP280 + QMI8658C data logger...")
+last_report = time.monotonic()
+# The bus/fault report below runs on the same interval as the memory report
+profiler = memprof.LoopProfiler(report_interval=REPORT_INTERVAL)
+
+def set_imu_interval(value):
+    """Applies a new IMU interval from the serial console"""
+    bus.set_interval("QMI8658C", value)
+
+def set_bmp280_interval(value):
+    """Applies a new BMP280 interval from the serial console"""
+    bus.set_interval("BMP280", value)
+
+def set_report_interval(value):
+    """Applies a new report interval from the serial console"""
+    profiler.report_interval = value
+
+params = live_params.LiveParams()
+params.define("IMU_INTERVAL", IMU_INTERVAL, 0.01, 3600.0, on_change=set_imu_interval)
+params.define("BMP280_INTERVAL", BMP280_INTERVAL, 0.01, 3600.0, on_change=set_bmp280_interval)
+params.define("REPORT_INTERVAL", REPORT_INTERVAL, 1.0, 86400.0, on_change=set_report_interval)
+
+while True:
+    with profiler:
+        # Apply any settings typed into the serial console (no reboot, sensor state is kept)
+        params.poll()
+
+        # Recovery attempts never sleep, so they can run on every pass
+        for supervisor in sensors:
+            supervisor.poll()
+        bus.run_pending()
+
+        data = bus.take("QMI8658C")
+        if data is not None:
+            print_imu(data)
+        data = bus.take("BMP280")
+        if data is not None:
+            print_bmp280(data)
+
+        # Print per-device bus utilization and fault counters
+        if time.monotonic() - last_report >= params["REPORT_INTERVAL"]:
+            bus.report()
+            for supervisor in sensors:
+                supervisor.report()
+            last_report = time.monotonic()
+
+    # Sleep until the next reading, recovery attempt or command check is due
+    wait = min(bus.time_until_next(), COMMAND_LATENCY)
+    for supervisor in sensors:
+        wait = min(wait, supervisor.time_until_retry())
+    profiler.sleep(wait)
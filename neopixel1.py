@@ -7,12 +7,22 @@
 # PREREQUISITE LIBRARIES (Must be in your lib folder):
 # 1. adafruit_bus_device (still useful for other components, though not strictly needed here)
 # 2. neopixel
+#
+# PREREQUISITE FILES (Must be next to code.py or in your lib folder):
+# 1. memprof.py
+# 2. live_params.py (settings can be changed over serial; type "list" to see them)
 
 import board
 import time
 import displayio
 import digitalio   # Needed for backlight control
 import neopixel    # Library for NeoPixel control
+import memprof     # Heap/GC stats for the main loop
+import live_params # Change settings over serial without a reboot
+
+# --- Effect Settings (can be changed live over serial) ---
+BRIGHTNESS = 0.3            # Keep brightness moderate
+FRAME_DELAY = 0.01          # Fast update rate for smooth animation
 
 # --- 1. Display Shutdown (Power Saving) ---
 
@@ -54,7 +64,7 @@ try:
     pixels = neopixel.NeoPixel(
         board.NEOPIXEL, 
         num_pixels, 
-        brightness=0.3, # Keep brightness moderate
+        brightness=BRIGHTNESS, # Keep brightness moderate
         auto_write=False
     )
     print("NeoPixel initialized successfully.")
@@ -83,17 +93,30 @@ def wheel(pos):
 
 print("Starting NeoPixel color cycle...")
 i = 0
+profiler = memprof.LoopProfiler()
+
+def set_brightness(value):
+    """Applies a new brightness from the serial console"""
+    pixels.brightness = value
+
+params = live_params.LiveParams()
+params.define("BRIGHTNESS", BRIGHTNESS, 0.0, 1.0, on_change=set_brightness)
+params.define("FRAME_DELAY", FRAME_DELAY, 0.0, 10.0)
 
 while True:
-    # Cycle the color of the single NeoPixel
-    color = wheel(i & 255)
-    pixels[0] = color
-    pixels.show()
-
-    # Increment the color wheel index
-    i += 1
-    if i > 255:
-        i = 0
+    with profiler:
+        # Apply any settings typed into the serial console
+        params.poll()
+
+        # Cycle the color of the single NeoPixel
+        color = wheel(i & 255)
+        pixels[0] = color
+        pixels.show()
+
+        # Increment the color wheel index
+        i += 1
+        if i > 255:
+            i = 0
     
-    # Fast update rate for smooth animation
-    time.sleep(0.01)
+    # Fast update rate for smooth animation (GC runs in this slack if needed)
+    profiler.sleep(params["FRAME_DELAY"])
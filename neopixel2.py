@@ -7,16 +7,25 @@
 # PREREQUISITE LIBRARIES (Must be in your lib folder):
 # 1. adafruit_bus_device (still useful for other components, though not strictly needed here)
 # 2. neopixel
+#
+# PREREQUISITE FILES (Must be next to code.py or in your lib folder):
+# 1. memprof.py
+# 2. live_params.py (settings can be changed over serial; type "list" to see them)
 
 import board
 import time
 import displayio
 import digitalio   # Needed for backlight control
 import neopixel    # Library for NeoPixel control
+import memprof     # Heap/GC stats for the main loop
+import live_params # Change settings over serial without a reboot
 
 # --- Color Definitions for Blinking Effect ---
 RED = (255, 0, 0)
 BLUE = (0, 0, 255)
+BRIGHTNESS = 0.5            # Increased brightness slightly for a clearer flash
+FLASH_DELAY = 0.25          # Wait a quarter second for a clear flash effect
+# All four can be changed live over serial, e.g. "set RED 255,64,0"
 
 
 # --- 1. Display Shutdown (Power Saving) ---
@@ -59,7 +68,7 @@ try:
     pixels = neopixel.NeoPixel(
         board.NEOPIXEL, 
         num_pixels, 
-        brightness=0.5, # Increased brightness slightly for a clearer flash
+        brightness=BRIGHTNESS, # Increased brightness slightly for a clearer flash
         auto_write=False
     )
     print("NeoPixel initialized successfully.")
@@ -73,14 +82,29 @@ except Exception as e:
 # --- 3. Main Loop: NeoPixel Animation ---
 
 print("Starting NeoPixel Red/Blue alternating flash...")
+profiler = memprof.LoopProfiler()
+
+def set_brightness(value):
+    """Applies a new brightness from the serial console"""
+    pixels.brightness = value
+
+params = live_params.LiveParams()
+params.define("RED", RED, 0, 255)
+params.define("BLUE", BLUE, 0, 255)
+params.define("BRIGHTNESS", BRIGHTNESS, 0.0, 1.0, on_change=set_brightness)
+params.define("FLASH_DELAY", FLASH_DELAY, 0.0, 10.0)
 
 while True:
     # Set to RED
-    pixels[0] = RED
-    pixels.show()
-    time.sleep(0.25) # Wait a quarter second for a clear flash effect
+    with profiler:
+        params.poll()
+        pixels[0] = params["RED"]
+        pixels.show()
+    profiler.sleep(params["FLASH_DELAY"]) # Wait for a clear flash effect
 
     # Set to BLUE
-    pixels[0] = BLUE
-    pixels.show()
-    time.sleep(0.25) # Wait a quarter second
+    with profiler:
+        params.poll()
+        pixels[0] = params["BLUE"]
+        pixels.show()
+    profiler.sleep(params["FLASH_DELAY"])
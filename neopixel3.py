@@ -7,18 +7,25 @@
 # PREREQUISITE LIBRARIES (Must be in your lib folder):
 # 1. adafruit_bus_device (still useful for other components, though not strictly needed here)
 # 2. neopixel
+#
+# PREREQUISITE FILES (Must be next to code.py or in your lib folder):
+# 1. memprof.py
+# 2. live_params.py (settings can be changed over serial; type "list" to see them)
 
 import board
 import time
 import displayio
 import digitalio   # Needed for backlight control
 import neopixel    # Library for NeoPixel control
+import memprof     # Heap/GC stats for the main loop
+import live_params # Change settings over serial without a reboot
 
 # --- Color/Effect Definitions ---
 PULSE_COLOR = (128, 0, 128)  # A medium intensity Purple
 MAX_BRIGHTNESS = 0.6         # Peak brightness for the pulse
 FADE_RATE = 0.02             # How quickly the brightness changes per step
 PULSE_SPEED = 0.01           # Delay between brightness changes (controls smoothness)
+# All four can be changed live over serial, e.g. "set FADE_RATE 0.05"
 
 
 # --- 1. Display Shutdown (Power Saving) ---
@@ -79,24 +86,39 @@ except Exception as e:
 print("Starting NeoPixel Purple Pulsing (Breathing) effect...")
 
 current_brightness = 0.0
+profiler = memprof.LoopProfiler()
+
+def set_color(value):
+    """Applies a new pulse color from the serial console"""
+    pixels[0] = value
+
+params = live_params.LiveParams()
+params.define("PULSE_COLOR", PULSE_COLOR, 0, 255, on_change=set_color)
+params.define("MAX_BRIGHTNESS", MAX_BRIGHTNESS, 0.001, 1.0)
+params.define("FADE_RATE", FADE_RATE, 0.001, 1.0)
+params.define("PULSE_SPEED", PULSE_SPEED, 0.0, 10.0)
+
+fading_in = True
 
+# Each pass polls the console, takes one step, and sleeps, so the loop never
+# spins even while a parameter change is being applied
 while True:
-    # --- Fade In (0.0 to MAX_BRIGHTNESS) ---
-    while current_brightness < MAX_BRIGHTNESS:
-        current_brightness += FADE_RATE
-        if current_brightness > MAX_BRIGHTNESS:
-            current_brightness = MAX_BRIGHTNESS
-        
-        pixels.brightness = current_brightness
-        pixels.show()
-        time.sleep(PULSE_SPEED)
+    with profiler:
+        params.poll()
+        peak = params["MAX_BRIGHTNESS"]
+        if fading_in:
+            # --- Fade In (0.0 to MAX_BRIGHTNESS) ---
+            current_brightness += params["FADE_RATE"]
+            if current_brightness >= peak:
+                current_brightness = peak
+                fading_in = False
+        else:
+            # --- Fade Out (MAX_BRIGHTNESS to 0.0) ---
+            current_brightness -= params["FADE_RATE"]
+            if current_brightness <= 0.0:
+                current_brightness = 0.0
+                fading_in = True
 
-    # --- Fade Out (MAX_BRIGHTNESS to 0.0) ---
-    while current_brightness > 0.0:
-        current_brightness -= FADE_RATE
-        if current_brightness < 0.0:
-            current_brightness = 0.0
-        
         pixels.brightness = current_brightness
         pixels.show()
-        time.sleep(PULSE_SPEED)
+    profiler.sleep(params["PULSE_SPEED"])
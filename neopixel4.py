@@ -7,6 +7,10 @@
 # PREREQUISITE LIBRARIES (Must be in your lib folder):
 # 1. adafruit_bus_device (still useful for other components, though not strictly needed here)
 # 2. neopixel
+#
+# PREREQUISITE FILES (Must be next to code.py or in your lib folder):
+# 1. memprof.py
+# 2. live_params.py (settings can be changed over serial; type "list" to see them)
 
 import board
 import time
@@ -14,12 +18,15 @@ import displayio
 import digitalio   # Needed for backlight control
 import neopixel    # Library for NeoPixel control
 import random      # Needed for the unique "Fire Flicker" effect
+import memprof     # Heap/GC stats for the main loop
+import live_params # Change settings over serial without a reboot
 
 # --- Color/Effect Definitions ---
 # The Fire Flicker effect simulates a flame using randomized warm colors and brightness.
 MAX_BRIGHTNESS = 0.6         # Peak brightness for the flicker
 MIN_BRIGHTNESS = 0.1         # Minimum brightness
 FLICKER_DELAY = 0.03         # Time delay between flickers (controls speed)
+# All three can be changed live over serial, e.g. "set FLICKER_DELAY 0.08"
 
 
 # --- 1. Display Shutdown (Power Saving) ---
@@ -92,17 +99,29 @@ def random_fire_color():
 def random_fire_brightness():
     """Generates a random brightness value within the defined range"""
     # Generates a float between MIN_BRIGHTNESS and MAX_BRIGHTNESS
-    return random.uniform(MIN_BRIGHTNESS, MAX_BRIGHTNESS)
+    return random.uniform(params["MIN_BRIGHTNESS"], params["MAX_BRIGHTNESS"])
+
+profiler = memprof.LoopProfiler()
+
+params = live_params.LiveParams()
+params.define("MAX_BRIGHTNESS", MAX_BRIGHTNESS, 0.0, 1.0)
+params.define("MIN_BRIGHTNESS", MIN_BRIGHTNESS, 0.0, 1.0)
+params.define("FLICKER_DELAY", FLICKER_DELAY, 0.0, 10.0)
 
 while True:
-    # 1. Set a random warm color
-    pixels[0] = random_fire_color()
+    with profiler:
+        # Apply any settings typed into the serial console
+        params.poll()
+
+        # 1. Set a random warm color
+        pixels[0] = random_fire_color()
     
-    # 2. Set a random brightness level
-    pixels.brightness = random_fire_brightness()
+        # 2. Set a random brightness level
+        pixels.brightness = random_fire_brightness()
     
-    # 3. Update the pixel
-    pixels.show()
+        # 3. Update the pixel
+        pixels.show()
     
     # 4. Wait a short, random amount of time for a less predictable flicker
-    time.sleep(random.uniform(FLICKER_DELAY * 0.5, FLICKER_DELAY * 1.5))
+    delay = params["FLICKER_DELAY"]
+    profiler.sleep(random.uniform(delay * 0.5, delay * 1.5))
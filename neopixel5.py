@@ -7,18 +7,25 @@
 # PREREQUISITE LIBRARIES (Must be in your lib folder):
 # 1. adafruit_bus_device (still useful for other components, though not strictly needed here)
 # 2. neopixel
+#
+# PREREQUISITE FILES (Must be next to code.py or in your lib folder):
+# 1. memprof.py
+# 2. live_params.py (settings can be changed over serial; type "list" to see them)
 
 import board
 import time
 import displayio
 import digitalio   # Needed for backlight control
 import neopixel    # Library for NeoPixel control
+import memprof     # Heap/GC stats for the main loop
+import live_params # Change settings over serial without a reboot
 # Removed 'random' as it is not needed for this effect
 
 # --- Color/Effect Definitions (Ocean Wave) ---
 # Simulates a gentle ocean wave by smoothly cycling between blue and cyan.
 WAVE_SPEED = 0.02           # Delay between color steps (controls speed/smoothness)
 BRIGHTNESS = 0.5            # Fixed brightness for smooth color transitions
+# Both can be changed live over serial, e.g. "set WAVE_SPEED 0.05"
 color_step = 0              # Global variable to track the position in the color cycle
 
 
@@ -91,17 +98,30 @@ except Exception as e:
 # --- 3. Main Loop: NeoPixel Animation ---
 
 print("Starting NeoPixel Ocean Wave effect (Blue/Cyan cycle)...")
+profiler = memprof.LoopProfiler()
+
+def set_brightness(value):
+    """Applies a new brightness from the serial console"""
+    pixels.brightness = value
+
+params = live_params.LiveParams()
+params.define("WAVE_SPEED", WAVE_SPEED, 0.0, 10.0)
+params.define("BRIGHTNESS", BRIGHTNESS, 0.0, 1.0, on_change=set_brightness)
 
 while True:
-    # 1. Set the color based on the current step
-    pixels[0] = ocean_wheel(color_step)
+    with profiler:
+        # Apply any settings typed into the serial console
+        params.poll()
+
+        # 1. Set the color based on the current step
+        pixels[0] = ocean_wheel(color_step)
     
-    # 2. Update the pixel
-    pixels.show()
+        # 2. Update the pixel
+        pixels.show()
     
-    # 3. Increment the color step
-    # Removed 'global color_step' as it is unnecessary in the module scope
-    color_step += 1
+        # 3. Increment the color step
+        # Removed 'global color_step' as it is unnecessary in the module scope
+        color_step += 1
     
     # 4. Wait for the next step
-    time.sleep(WAVE_SPEED)
+    profiler.sleep(params["WAVE_SPEED"])
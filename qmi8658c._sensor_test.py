@@ -6,13 +6,29 @@
 #
 # PREREQUISITE LIBRARIES (Must be in your lib folder):
 # 1. qmi8658c (User's specific library name/structure)
+#
+# PREREQUISITE FILES (Must be next to code.py or in your lib folder):
+# 1. i2c_discovery.py
+# 2. i2c_bus.py
+# 3. sensor_recovery.py
+# 4. memprof.py
+# 5. telemetry.py
+# 6. live_params.py (settings can be changed over serial; type "list" to see them)
 
 import board
-import time
-import busio       # busio is implicitly required for board.I2C()
 import displayio
 import digitalio   # Needed for backlight control
-import qmi8658c    # User's specified IMU library
+import i2c_discovery # Finds the QMI8658C address (0x6B or 0x6A) and caches it
+import i2c_bus       # Shared I2C bus with a configurable clock and scheduler
+import sensor_recovery # Retries a failed sensor in the background
+import memprof       # Heap/GC stats for the main loop
+import telemetry     # Binary records on the USB data port (if enabled in boot.py)
+import live_params   # Change settings over serial without a reboot
+
+# --- Bus/Sampling Settings ---
+I2C_FREQUENCY = 400000      # Bus clock in Hz: 100000, 400000 or 1000000
+SAMPLE_INTERVAL = 0.5       # Seconds between IMU readings (can be changed live over serial)
+COMMAND_LATENCY = 0.05      # Longest sleep, so serial commands are handled promptly
 
 # --- 1. Display Shutdown (Power Saving) ---
 
@@ -47,51 +63,78 @@ print("-" * 40)
 
 # --- 2. Sensor Setup ---
 
-# Initialize the I2C bus using the board's default I2C setup (board.SCL/board.SDA)
-try:
-    i2c = board.I2C()
+# Initialize the I2C bus on the board's default pins (board.SCL/board.SDA).
+# board.I2C() is fixed at 100 kHz, so the bus manager creates it instead.
+# If the bus cannot be created yet, the sensor supervisor keeps resetting it.
+bus = i2c_bus.BusManager(frequency=I2C_FREQUENCY)
+if bus.i2c is not None:
     print("I2C bus initialized successfully.")
-except Exception as e:
-    print(f"Error initializing I2C bus: {e}")
-    # Halt program if I2C fails
-    while True:
-        time.sleep(1)
 
 # Initialize the QMI8658C sensor object using the user's specific module structure
-try:
-    sensor = qmi8658c.QMI8658C(i2c)
+# The address is detected from the WHO_AM_I register on the first boot and
+# read from NVM afterwards. A failed init does not halt the program: the
+# supervisor keeps retrying (with bus resets and backoff) while the loop runs.
+sensor = sensor_recovery.SensorSupervisor(
+    "QMI8658C", bus, lambda i2c: i2c_discovery.find_sensor(i2c, "QMI8658C")
+)
+if sensor.start():
     print("QMI8658C IMU sensor found and initialized.")
-except Exception as e:
-    print(f"An unexpected error occurred during QMI8658C initialization: {e}")
-    print("Check if the 'qmi8658c' library is correctly installed and named.")
-    while True:
-        time.sleep(5)
+else:
+    print("QMI8658C not available yet; retrying in the background.")
+    print("Check the wiring and that the 'qmi8658c' library is correctly installed and named.")
 
 
 # --- 3. Main Loop: Read and Print Data ---
 
 print("Starting QMI8658C data logger...")
 
+def sample_qmi8658c(imu):
+    """Reads (acceleration, gyro, temperature) from the driver"""
+    # Acceleration in m/s^2, gyroscope in degrees/s
+    return imu.acceleration, imu.gyro, imu.temperature
+
+def read_qmi8658c():
+    """Bus task: returns one reading (None while the sensor is down or recovering)"""
+    return sensor.read(sample_qmi8658c)
+
+def print_qmi8658c(data):
+    """Prints one block of data (kept out of the bus task so it is not timed as bus use)"""
+    (acc_x, acc_y, acc_z), (gyro_x, gyro_y, gyro_z), temperature = data
+    telemetry.send(
+        telemetry.RECORD_QMI8658C,
+        acc_x, acc_y, acc_z, gyro_x, gyro_y, gyro_z, temperature,
+    )
+
+    # Print data using user's requested format
+    print("-" * 40)
+    print("Acceleration: (%.2f, %.2f, %.2f) m/s^2" % (acc_x, acc_y, acc_z))
+    print("Gyroscope:    (%.2f, %.2f, %.2f) degrees/s" % (gyro_x, gyro_y, gyro_z))
+    print("Temperature:  %.2f °C" % temperature)
+    print("-" * 40)
+
+bus.add_task("QMI8658C", read_qmi8658c, SAMPLE_INTERVAL, priority=1)
+
+profiler = memprof.LoopProfiler()
+
+def set_sample_interval(value):
+    """Applies a new sample interval from the serial console"""
+    bus.set_interval("QMI8658C", value)
+
+params = live_params.LiveParams()
+params.define("SAMPLE_INTERVAL", SAMPLE_INTERVAL, 0.01, 3600.0, on_change=set_sample_interval)
+
 while True:
-    try:
-        # Get acceleration data in m/s^2
-        acc_x, acc_y, acc_z = sensor.acceleration
-        
-        # Get gyroscope data in degrees/s
-        gyro_x, gyro_y, gyro_z = sensor.gyro
-        
-        # Get temperature data
-        temperature = sensor.temperature
+    with profiler:
+        # Apply any settings typed into the serial console (no reboot, sensor state is kept)
+        params.poll()
 
-        # Print data using user's requested format
-        print("-" * 40)
-        print("Acceleration: (%.2f, %.2f, %.2f) m/s^2" % (acc_x, acc_y, acc_z))
-        print("Gyroscope:    (%.2f, %.2f, %.2f) degrees/s" % (gyro_x, gyro_y, gyro_z))
-        print("Temperature:  %.2f °C" % temperature)
-        print("-" * 40)
+        # Recovery attempts never sleep, so they can run on every pass
+        sensor.poll()
+        bus.run_pending()
 
-    except Exception as e:
-        print(f"Error reading sensor data: {e}")
+        data = bus.take("QMI8658C")
+        if data is not None:
+            print_qmi8658c(data)
 
-    # Add a delay to prevent flooding the serial monitor (0.5s)
-    time.sleep(0.5)
+    # Sleep until the next reading, recovery attempt or command check is due
+    profiler.sleep(min(bus.time_until_next(), sensor.time_until_retry(), COMMAND_LATENCY))
@@ -0,0 +1,181 @@
+# CircuitPython Non-Blocking Sensor Fault Recovery
+#
+# Copy this file next to code.py (or into /lib). A SensorSupervisor wraps one
+# I2C sensor driver. When an init or a read fails, the sensor is marked down
+# and the main loop keeps running; poll() then retries in the background:
+#
+#   1. first retry: recreate the driver right away
+#   2. later retries: wait 20 ms, 40 ms, 80 ms ... between attempts
+#      (exponential backoff), up to 2 s after a bus error and up to 30 s
+#      while the chip is simply not found
+#
+# The bus is only reset (clock pulses + STOP, new I2C instance) when there
+# is evidence that it is stuck: an I/O error (OSError) from the chip, or no
+# usable I2C instance at all. The bus manager decides whether a requested
+# reset actually happens, so one missing sensor cannot keep resetting the
+# bus under the sensors that still work. A missing driver library (or a
+# driver that cannot be called this way) disables the sensor until reboot.
+#
+# No retry ever sleeps, so the other sensors and effects are not stalled.
+# Error counters and MTTR (mean time to recovery) are kept for telemetry.
+# Retry times are integer nanoseconds (time.monotonic_ns()), since the float
+# time.monotonic() gets too coarse for 20 ms steps after a few days of uptime.
+#
+# PREREQUISITE FILES (Must be next to code.py or in your lib folder):
+# 1. i2c_bus.py
+
+import time
+
+# --- Backoff Settings ---
+BASE_DELAY = 0.02            # Seconds before the second recovery attempt
+MAX_DELAY = 2.0              # Upper limit for the wait after a bus error
+MISSING_DELAY = 30.0         # Upper limit while the chip is not found
+
+
+class SensorSupervisor:
+    """Keeps one sensor driver alive across I2C faults without blocking"""
+
+    def __init__(
+        self, name, bus, init,
+        base_delay=BASE_DELAY, max_delay=MAX_DELAY, missing_delay=MISSING_DELAY,
+    ):
+        # `init` is called as init(i2c) and must return a ready driver
+        self.name = name
+        self.bus = bus
+        self._init = init
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.missing_delay = missing_delay
+        self.driver = None
+        self.disabled = False
+        self._generation = -1
+        self._attempts = 0
+        self._next_attempt_ns = 0
+        self._failed_at_ns = None
+        self._bus_suspect = False
+
+        # Telemetry counters
+        self.read_errors = 0
+        self.init_errors = 0
+        self.bus_resets = 0
+        self.recoveries = 0
+        self.downtime_ns = 0
+
+    @property
+    def is_up(self):
+        """True while the driver is usable"""
+        self._check_generation()
+        return self.driver is not None
+
+    @property
+    def mttr(self):
+        """Mean time to recovery in seconds (0 if it never had to recover)"""
+        return self.downtime_ns / self.recoveries / 1e9 if self.recoveries else 0.0
+
+    def _check_generation(self):
+        """Drops a driver that still points at an I2C instance the bus has replaced"""
+        if self.driver is not None and self._generation != self.bus.generation:
+            self.driver = None
+            self._next_attempt_ns = 0
+
+    def start(self):
+        """Tries to initialize the sensor now; returns True on success"""
+        self.poll()
+        return self.driver is not None
+
+    def poll(self):
+        """Runs one recovery attempt if the sensor is down and its backoff has expired"""
+        self._check_generation()
+        if self.driver is not None or self.disabled:
+            return
+        now = time.monotonic_ns()
+        if now < self._next_attempt_ns:
+            return
+
+        try:
+            if self.bus.i2c is None or (self._bus_suspect and self._attempts > 0):
+                # Recreating the driver alone did not help: ask for a bus reset
+                if self.bus.request_reset():
+                    self.bus_resets += 1
+            self.driver = self._init(self.bus.i2c)
+            self._generation = self.bus.generation
+        except (ImportError, TypeError) as e:
+            # Missing library or wrong driver call: retrying cannot fix this
+            self.init_errors += 1
+            self.disabled = True
+            print(f"{self.name} disabled: {e}")
+            return
+        except Exception as e:
+            self.init_errors += 1
+            if self._failed_at_ns is None:
+                self._failed_at_ns = now
+            if isinstance(e, OSError):
+                self._bus_suspect = True # I/O error: the bus itself may be stuck
+            if self._bus_suspect or self.bus.i2c is None:
+                limit = self.max_delay
+            else:
+                limit = self.missing_delay
+            delay = min(self.base_delay * (2 ** self._attempts), limit)
+            self._attempts += 1
+            self._next_attempt_ns = now + int(delay * 1e9)
+            if self._attempts == 1:
+                print(f"{self.name} init failed (retrying in the background): {e}")
+            return
+
+        if self._failed_at_ns is not None:
+            self.recoveries += 1
+            self.downtime_ns += time.monotonic_ns() - self._failed_at_ns
+            self._failed_at_ns = None
+            print(f"{self.name} recovered.")
+        self._attempts = 0
+        self._bus_suspect = False
+
+    def read(self, fn):
+        """Returns fn(driver), or None if the sensor is down or the read failed"""
+        self._check_generation()
+        if self.driver is None:
+            return None
+        try:
+            result = fn(self.driver)
+        except Exception as e:
+            self.read_errors += 1
+            print(f"Error reading {self.name} data: {e}")
+            # An I/O error on a driver that used to work points at the bus
+            self._bus_suspect = isinstance(e, OSError)
+            self.driver = None
+            self._failed_at_ns = time.monotonic_ns()
+            self._attempts = 0
+            self._next_attempt_ns = 0 # First retry right away
+            return None
+        self.bus.healthy()
+        return result
+
+    def time_until_retry(self):
+        """Seconds until poll() has work to do (a large value while the sensor is up)"""
+        if self.disabled or self.is_up:
+            return 3600.0
+        wait_ns = self._next_attempt_ns - time.monotonic_ns()
+        return wait_ns / 1e9 if wait_ns > 0 else 0
+
+    def stats(self):
+        """Returns the telemetry counters as a dict"""
+        return {
+            "up": self.driver is not None,
+            "read_errors": self.read_errors,
+            "init_errors": self.init_errors,
+            "bus_resets": self.bus_resets,
+            "recoveries": self.recoveries,
+            "mttr": self.mttr,
+        }
+
+    def report(self):
+        """Prints the telemetry counters to the serial console"""
+        if self.disabled:
+            state = "OFF"
+        else:
+            state = "UP" if self.is_up else "DOWN"
+        print(
+            f"  {self.name:<10} {state:<5} read errors: {self.read_errors:<4} "
+            f"init errors: {self.init_errors:<4} bus resets: {self.bus_resets:<4} "
+            f"recoveries: {self.recoveries:<4} MTTR: {self.mttr * 1000:.0f} ms"
+        )
@@ -0,0 +1,69 @@
+# CircuitPython Binary Telemetry
+#
+# Copy this file next to code.py (or into /lib). It packs sensor and memory
+# readings into small fixed-size binary records and writes them to the USB
+# "data" serial port, leaving the console (print output) untouched.
+#
+# The data port only exists if boot.py enables it:
+#
+#     import usb_cdc
+#     usb_cdc.enable(console=True, data=True)
+#
+# Without it, send() does nothing, so scripts can always call it.
+#
+# RECORD LAYOUT (little-endian):
+#   header:  sync (u8, 0xA5) | type (u8) | payload length (u16) | time ms (u32)
+#   payload: one of the formats in FORMATS below
+# The host-side reader in host_analysis/ uses the same layout.
+
+import struct
+import time
+
+try:
+    import usb_cdc
+    _port = usb_cdc.data
+except (ImportError, AttributeError):
+    _port = None
+
+if _port is not None:
+    # Never wait for the host: a full buffer drops the record instead
+    _port.write_timeout = 0
+
+SYNC = 0xA5
+HEADER_FORMAT = "<BBHI"
+
+# --- Record Types ---
+RECORD_BMP280 = 1    # temperature C, pressure hPa, altitude m
+RECORD_QMI8658C = 2  # accel x/y/z m/s^2, gyro x/y/z degrees/s, temperature C
+RECORD_MEMORY = 3    # see memprof.LoopProfiler.values()
+
+FORMATS = {
+    RECORD_BMP280: "<3f",
+    RECORD_QMI8658C: "<7f",
+    RECORD_MEMORY: "<8I",
+}
+
+
+def available():
+    """True if the USB data port is enabled"""
+    return _port is not None
+
+
+def pack(record_type, *values):
+    """Packs one record (header + payload) into bytes"""
+    payload_format = FORMATS[record_type]
+    timestamp = (time.monotonic_ns() // 1000000) & 0xFFFFFFFF
+    header = struct.pack(
+        HEADER_FORMAT, SYNC, record_type, struct.calcsize(payload_format), timestamp
+    )
+    return header + struct.pack(payload_format, *values)
+
+
+def send(record_type, *values):
+    """Writes one record to the USB data port (no-op when it is disabled)"""
+    if _port is None:
+        return
+    try:
+        _port.write(pack(record_type, *values))
+    except Exception:
+        pass # Host not connected or buffer full; telemetry is best effort